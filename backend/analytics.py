@@ -0,0 +1,237 @@
+"""CPU-bound analytics jobs run by the server's AnalyticsPool.
+
+Spawned pool workers import this module, not backend.server, so keep it free of
+the web app, the database client and other heavy imports: NumPy and the stdlib only.
+"""
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+def analytics_worker_ready() -> int:
+    return os.getpid()
+
+# ==================== PLAYER TOTALS ====================
+def calculate_game_fantasy_points(stats: dict) -> float:
+    """Calculate fantasy points for a single game performance"""
+    fp = 0.0
+    # Passing: 1 pt per 25 yards, 4 pts per TD, -2 per INT
+    fp += stats.get("pass_yards", 0) / 25
+    fp += stats.get("pass_tds", 0) * 4
+    fp -= stats.get("interceptions", 0) * 2
+    # Rushing: 1 pt per 10 yards, 6 pts per TD, -2 per fumble
+    fp += stats.get("rush_yards", 0) / 10
+    fp += stats.get("rush_tds", 0) * 6
+    fp -= stats.get("fumbles", 0) * 2
+    # Receiving: 1 pt per reception, 1 pt per 10 yards, 6 pts per TD
+    fp += stats.get("receptions", 0)
+    fp += stats.get("rec_yards", 0) / 10
+    fp += stats.get("rec_tds", 0) * 6
+    # Defense: 1 pt per tackle, 2 pts per sack, 3 pts per INT, 6 pts per TD, 2 pts per safety
+    fp += stats.get("tackles", 0)
+    fp += stats.get("sacks", 0) * 2
+    fp += stats.get("def_interceptions", 0) * 3
+    fp += stats.get("def_tds", 0) * 6
+    fp += stats.get("safeties", 0) * 2
+    return round(fp, 1)
+
+def player_total_touchdowns(player: dict) -> int:
+    """Touchdowns across all four stat categories (stored on the player for indexed leaderboards)"""
+    return (
+        player.get("passing", {}).get("touchdowns", 0) +
+        player.get("rushing", {}).get("touchdowns", 0) +
+        player.get("receiving", {}).get("touchdowns", 0) +
+        player.get("defense", {}).get("td", 0)
+    )
+
+RATE_STATS = {"completion_pct", "average", "rating", "yards_per_carry"}
+
+def apply_rate_stats(totals: Dict[str, Dict[str, Any]]):
+    """Fill the derived passing and rushing rates from counting totals, in place"""
+    passing, rushing = totals["passing"], totals["rushing"]
+    if passing.get("attempts", 0) > 0:
+        passing["completion_pct"] = round(passing["completions"] / passing["attempts"] * 100, 1)
+        passing["average"] = round(passing["yards"] / passing["attempts"], 1)
+        # Simplified passer rating
+        passing["rating"] = round(
+            ((passing["completion_pct"] - 30) * 0.05 +
+             (passing["touchdowns"] / passing["attempts"] * 100) * 0.2 +
+             (passing["yards"] / passing["attempts"]) * 0.083 -
+             (passing["interceptions"] / passing["attempts"] * 100) * 0.1) * 10, 1
+        )
+    if rushing.get("attempts", 0) > 0:
+        rushing["yards_per_carry"] = round(rushing["yards"] / rushing["attempts"], 1)
+
+def aggregate_player_season(game_stats: List[dict]) -> tuple:
+    """Season totals ($set fields for the player) and weekly scores from one player's game stats"""
+    # Aggregate stats
+    totals = {
+        "passing": {"completions": 0, "attempts": 0, "yards": 0, "touchdowns": 0, "interceptions": 0, "longest": 0},
+        "rushing": {"attempts": 0, "yards": 0, "touchdowns": 0, "fumbles": 0, "longest": 0, "twenty_plus": 0},
+        "receiving": {"receptions": 0, "yards": 0, "touchdowns": 0, "drops": 0, "longest": 0},
+        "defense": {"tackles": 0, "tackles_for_loss": 0, "sacks": 0, "swat": 0, "interceptions": 0, "pass_deflections": 0, "td": 0, "safeties": 0}
+    }
+    
+    weekly_scores = []
+    games_played = 0
+    
+    for gs in game_stats:
+        games_played += 1
+        game_fp = calculate_game_fantasy_points(gs)
+        weekly_scores.append({"week": gs.get("week", games_played), "points": game_fp})
+        
+        # Passing
+        totals["passing"]["completions"] += gs.get("pass_completions", 0)
+        totals["passing"]["attempts"] += gs.get("pass_attempts", 0)
+        totals["passing"]["yards"] += gs.get("pass_yards", 0)
+        totals["passing"]["touchdowns"] += gs.get("pass_tds", 0)
+        totals["passing"]["interceptions"] += gs.get("interceptions", 0)
+        totals["passing"]["longest"] = max(totals["passing"]["longest"], gs.get("longest_pass", 0))
+        
+        # Rushing
+        totals["rushing"]["attempts"] += gs.get("rush_attempts", 0)
+        totals["rushing"]["yards"] += gs.get("rush_yards", 0)
+        totals["rushing"]["touchdowns"] += gs.get("rush_tds", 0)
+        totals["rushing"]["fumbles"] += gs.get("fumbles", 0)
+        totals["rushing"]["longest"] = max(totals["rushing"]["longest"], gs.get("longest_rush", 0))
+        if gs.get("rush_yards", 0) >= 20:
+            totals["rushing"]["twenty_plus"] += 1
+        
+        # Receiving
+        totals["receiving"]["receptions"] += gs.get("receptions", 0)
+        totals["receiving"]["yards"] += gs.get("rec_yards", 0)
+        totals["receiving"]["touchdowns"] += gs.get("rec_tds", 0)
+        totals["receiving"]["drops"] += gs.get("drops", 0)
+        totals["receiving"]["longest"] = max(totals["receiving"]["longest"], gs.get("longest_rec", 0))
+        
+        # Defense
+        totals["defense"]["tackles"] += gs.get("tackles", 0)
+        totals["defense"]["tackles_for_loss"] += gs.get("tackles_for_loss", 0)
+        totals["defense"]["sacks"] += gs.get("sacks", 0)
+        totals["defense"]["swat"] += gs.get("swat", 0)
+        totals["defense"]["interceptions"] += gs.get("def_interceptions", 0)
+        totals["defense"]["pass_deflections"] += gs.get("pass_deflections", 0)
+        totals["defense"]["td"] += gs.get("def_tds", 0)
+        totals["defense"]["safeties"] += gs.get("safeties", 0)
+    
+    apply_rate_stats(totals)
+    
+    total_fp = sum(ws["points"] for ws in weekly_scores)
+    
+    player_updates = {
+        "passing": totals["passing"],
+        "rushing": totals["rushing"],
+        "receiving": totals["receiving"],
+        "defense": totals["defense"],
+        "fantasy_points": round(total_fp, 1),
+        "total_touchdowns": player_total_touchdowns(totals),
+        "games_played": games_played
+    }
+    return player_updates, weekly_scores
+
+def aggregate_league_season(player_ids: List[str], offsets: np.ndarray, weeks: np.ndarray,
+                            int_stats: np.ndarray, int_fields: List[str],
+                            float_stats: np.ndarray, float_fields: List[str]) -> List[tuple]:
+    """Analytics-pool side of recalculate_all_player_stats: aggregate_player_season for every player.
+
+    Rows are grouped by player; offsets[i] is the first row of player_ids[i].
+    """
+    bounds = offsets.tolist() + [len(weeks)]
+    week_list, int_rows, float_rows = weeks.tolist(), int_stats.tolist(), float_stats.tolist()
+    results = []
+    for i in range(len(player_ids)):
+        rows = [
+            {"week": week_list[r], **dict(zip(int_fields, int_rows[r])), **dict(zip(float_fields, float_rows[r]))}
+            for r in range(bounds[i], bounds[i + 1])
+        ]
+        results.append(aggregate_player_season(rows))
+    return results
+
+# ==================== SEASON SIMULATION ====================
+PLAYOFF_ROUNDS = ["Playins", "Wildcard", "Divisional", "Conference", "Championship"]
+PLAYOFF_CONFERENCES = ["Ridge", "Grand Central"]
+
+def simulate_league(inputs: Dict[str, Any], iterations: int, seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """Play out the remaining schedule and the bracket `iterations` times at once.
+
+    Scores are drawn per game from Normal((offense + opponent defense) / 2, score_sd), so
+    records and points-for tiebreaks evolve exactly as recalculate_all_standings seeds them.
+    """
+    rng = np.random.default_rng(seed)
+    offense, defense, sd = inputs["offense"], inputs["defense"], inputs["score_sd"]
+    n_teams = len(offense)
+    rows = np.arange(iterations)
+
+    def draw(mean: np.ndarray) -> np.ndarray:
+        noise = rng.standard_normal(mean.shape, dtype=np.float32)
+        return np.maximum(mean.astype(np.float32) + np.float32(sd) * noise, 0)
+
+    wins = np.tile(inputs["wins"], (iterations, 1))
+    points_for = np.tile(inputs["points_for"], (iterations, 1))
+    home, away = inputs["home"], inputs["away"]
+    if len(home):
+        home_pts = draw(np.broadcast_to((offense[home] + defense[away]) / 2, (iterations, len(home))))
+        away_pts = draw(np.broadcast_to((offense[away] + defense[home]) / 2, (iterations, len(home))))
+        # One-hot schedule matrices turn per-game results into per-team totals with two matmuls
+        home_onehot = np.zeros((len(home), n_teams))
+        home_onehot[np.arange(len(home)), home] = 1
+        away_onehot = np.zeros((len(away), n_teams))
+        away_onehot[np.arange(len(away)), away] = 1
+        wins += (home_pts > away_pts) @ home_onehot + (away_pts > home_pts) @ away_onehot
+        points_for += home_pts @ home_onehot + away_pts @ away_onehot
+
+    # Seeds by wins, then points for, within each conference
+    conference = inputs["conference"]
+    seeded: List[np.ndarray] = []
+    largest_conference = max(int((conference == c).sum()) for c in range(len(PLAYOFF_CONFERENCES)))
+    seed_counts = np.zeros((n_teams, max(largest_conference, 1)))
+    for c in range(len(PLAYOFF_CONFERENCES)):
+        members = np.flatnonzero(conference == c)
+        order = np.argsort(-(wins[:, members] * 1e6 + points_for[:, members]), axis=1, kind="stable")
+        ranked = members[order]
+        seeded.append(ranked)
+        for position in range(len(members)):
+            seed_counts[:, position] += np.bincount(ranked[:, position], minlength=n_teams)
+
+    def resolve(slot, winners: Dict[str, np.ndarray]) -> np.ndarray:
+        if slot is None:
+            return np.full(iterations, -1)
+        if slot[0] == "team":
+            return np.full(iterations, slot[1])
+        if slot[0] == "seed":
+            ranked = seeded[slot[1]]
+            return ranked[:, slot[2] - 1] if slot[2] <= ranked.shape[1] else np.full(iterations, -1)
+        return winners.get(slot[1], np.full(iterations, -1))
+
+    round_counts = {name: np.zeros(n_teams) for name in PLAYOFF_ROUNDS}
+    in_playoffs = np.zeros((iterations, n_teams), dtype=bool)
+    winners: Dict[str, np.ndarray] = {}
+    champion = np.full(iterations, -1)
+    for matchup_id, round_name, slot1, slot2, fixed_winner in inputs["bracket"]:
+        team1, team2 = resolve(slot1, winners), resolve(slot2, winners)
+        for side in (team1, team2):
+            present = side >= 0
+            in_playoffs[rows[present], side[present]] = True
+            if round_name in round_counts:
+                round_counts[round_name] += np.bincount(side[present], minlength=n_teams)
+        winner = np.where(team1 >= 0, team1, team2)
+        if fixed_winner is not None:
+            winner = np.full(iterations, fixed_winner)
+        else:
+            contested = (team1 >= 0) & (team2 >= 0)
+            a, b = team1[contested], team2[contested]
+            score1 = draw((offense[a] + defense[b]) / 2)
+            score2 = draw((offense[b] + defense[a]) / 2)
+            winner[contested] = np.where(score2 > score1, b, a)
+        winners[matchup_id] = winner
+        if round_name == "Championship":
+            champion = winner
+
+    return {
+        "expected_wins": wins.mean(axis=0),
+        "expected_points_for": points_for.mean(axis=0),
+        "seed_probs": seed_counts / iterations,
+        "playoff_probs": in_playoffs.mean(axis=0),
+        "round_probs": np.stack([round_counts[name] / iterations for name in PLAYOFF_ROUNDS], axis=1),
+        "champion_probs": np.bincount(champion[champion >= 0], minlength=n_teams) / iterations,
+    }
@@ -0,0 +1,52 @@
+import { useEffect, useRef } from 'react';
+import API from '../lib/api';
+
+// One EventSource per tab, shared by every component that subscribes
+let source = null;
+let subscribers = 0;
+
+const acquire = () => {
+  if (!source) {
+    source = new EventSource(`${API}/events`);
+  }
+  subscribers += 1;
+  return source;
+};
+
+const release = () => {
+  subscribers -= 1;
+  if (subscribers === 0 && source) {
+    source.close();
+    source = null;
+  }
+};
+
+// Calls onEvent(type, data) for each listed /api/events type. A "resync" event
+// means updates were missed, so subscribers are called for every listed type.
+export const useLeagueEvents = (types, onEvent) => {
+  const handlerRef = useRef(onEvent);
+  handlerRef.current = onEvent;
+  const key = types.join(',');
+
+  useEffect(() => {
+    if (typeof EventSource === 'undefined') return undefined;
+    const es = acquire();
+    const listeners = key.split(',').map((type) => {
+      const listener = (e) => handlerRef.current(type, JSON.parse(e.data));
+      es.addEventListener(type, listener);
+      return [type, listener];
+    });
+    const onResync = (e) => {
+      const data = JSON.parse(e.data);
+      key.split(',').forEach((type) => handlerRef.current(type, data));
+    };
+    es.addEventListener('resync', onResync);
+    return () => {
+      listeners.forEach(([type, listener]) => es.removeEventListener(type, listener));
+      es.removeEventListener('resync', onResync);
+      release();
+    };
+  }, [key]);
+};
+
+export default useLeagueEvents;
@@ -28,6 +28,9 @@ const AdminPanel = () => {
   const [playoffs, setPlayoffs] = useState([]);
   const [admins, setAdmins] = useState([]);
   const [activityLog, setActivityLog] = useState([]);
+  const [activityCursor, setActivityCursor] = useState(null);
+  const [activityAction, setActivityAction] = useState('all');
+  const [activityCounts, setActivityCounts] = useState([]);
   const [analytics, setAnalytics] = useState(null);
   const [loading, setLoading] = useState(false);
   const [activeTab, setActiveTab] = useState('overview');
@@ -93,7 +96,7 @@ const AdminPanel = () => {
         axios.get(`${API}/trades`),
         axios.get(`${API}/admin/playoffs`, { headers }),
         axios.get(`${API}/admin/admins`, { headers }),
-        axios.get(`${API}/admin/activity-log`, { headers }),
+        axios.get(`${API}/admin/activity-log?paged=true`, { headers }),
         axios.get(`${API}/player-analytics`)
       ]);
       setTeams(teamsRes.data);
@@ -102,13 +105,43 @@ const AdminPanel = () => {
       setTrades(tradesRes.data);
       setPlayoffs(playoffsRes.data.matchups || []);
       setAdmins(adminsRes.data);
-      setActivityLog(logRes.data);
+      setActivityLog(logRes.data.entries);
+      setActivityCursor(logRes.data.next_cursor);
+      setActivityAction('all');
       setAnalytics(analyticsRes.data);
     } catch (error) {
       console.error('Error fetching data:', error);
     }
   };
 
+  // Activity log: first page for a filter, then keyset pages appended on demand
+  const fetchActivity = async (action = activityAction, cursor = '') => {
+    try {
+      const params = new URLSearchParams({ paged: 'true' });
+      if (cursor) params.set('cursor', cursor);
+      if (action !== 'all') params.set('action', action);
+      const res = await axios.get(`${API}/admin/activity-log?${params}`, { headers });
+      setActivityLog(cursor ? [...activityLog, ...res.data.entries] : res.data.entries);
+      setActivityCursor(res.data.next_cursor);
+    } catch (error) {
+      toast.error('Failed to load activity');
+    }
+  };
+
+  const fetchActivityCounts = async () => {
+    try {
+      const res = await axios.get(`${API}/admin/activity-log/actions`, { headers });
+      setActivityCounts(res.data.actions);
+    } catch (error) {
+      console.error('Error fetching activity counts:', error);
+    }
+  };
+
+  useEffect(() => {
+    if (activeTab === 'activity') fetchActivityCounts();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [activeTab]);
+
   const refreshStats = async () => {
     try {
       const res = await axios.get(`${API}/admin/stats`, { headers });
@@ -465,11 +498,10 @@ const AdminPanel = () => {
 
   // Season Reset
   const resetSeason = async () => {
-    if (!window.confirm('WARNING: This will reset ALL season data. Are you sure?')) return;
-    if (!window.confirm('This action cannot be undone. Type "RESET" to confirm.')) return;
+    if (!window.confirm('Close the current season and start the next one? Records and stats reset to zero; the closed season stays viewable.')) return;
     try {
-      await axios.post(`${API}/admin/season/reset`, {}, { headers });
-      toast.success('Season reset complete');
+      const res = await axios.post(`${API}/admin/season/reset`, {}, { headers });
+      toast.success(`Season ${res.data.season} started`);
       fetchAllData();
     } catch (error) {
       toast.error('Failed to reset season');
@@ -1059,7 +1091,7 @@ const AdminPanel = () => {
                       <Check className="w-4 h-4 mr-2" /> Validate All Data
                     </Button>
                     <Button onClick={resetSeason} className="w-full justify-start bg-red-500/10 hover:bg-red-500/20 text-red-500">
-                      <RefreshCw className="w-4 h-4 mr-2" /> Reset Season
+                      <RefreshCw className="w-4 h-4 mr-2" /> Start New Season
                     </Button>
                   </CardContent>
                 </Card>
@@ -1498,7 +1530,18 @@ const AdminPanel = () => {
             {/* Activity Tab */}
             <TabsContent value="activity">
               <Card className="glass-panel border-white/10">
-                <CardHeader className="border-b border-white/5"><CardTitle className="font-heading font-bold text-lg uppercase flex items-center gap-2"><History className="w-5 h-5" /> Recent Activity</CardTitle></CardHeader>
+                <CardHeader className="border-b border-white/5 flex flex-row items-center justify-between">
+                  <CardTitle className="font-heading font-bold text-lg uppercase flex items-center gap-2"><History className="w-5 h-5" /> Recent Activity</CardTitle>
+                  <Select value={activityAction} onValueChange={(v) => { setActivityAction(v); fetchActivity(v); }}>
+                    <SelectTrigger className="w-56 bg-white/5 border-white/10"><SelectValue /></SelectTrigger>
+                    <SelectContent>
+                      <SelectItem value="all">All actions</SelectItem>
+                      {activityCounts.map(({ action, count }) => (
+                        <SelectItem key={action} value={action}>{action} ({count})</SelectItem>
+                      ))}
+                    </SelectContent>
+                  </Select>
+                </CardHeader>
                 <CardContent className="p-0 max-h-[600px] overflow-auto">
                   {activityLog.map(log => (
                     <div key={log.id} className="p-4 border-b border-white/5">
@@ -1510,6 +1553,11 @@ const AdminPanel = () => {
                       <div className="text-xs text-white/40 mt-1">by {log.admin}</div>
                     </div>
                   ))}
+                  {activityCursor && (
+                    <div className="p-4 text-center">
+                      <Button variant="outline" className="border-white/10" onClick={() => fetchActivity(activityAction, activityCursor)}>Load more</Button>
+                    </div>
+                  )}
                 </CardContent>
               </Card>
             </TabsContent>
@@ -35,8 +35,8 @@ const Dashboard = () => {
     setSearchQuery(query);
     if (query.length >= 2) {
       try {
-        const response = await axios.get(`${API}/players?search=${encodeURIComponent(query)}&limit=5`);
-        setSearchResults(response.data);
+        const response = await axios.get(`${API}/players/search?q=${encodeURIComponent(query)}&limit=5`);
+        setSearchResults(response.data.results);
         setShowSearch(true);
       } catch (error) {
         console.error('Search error:', error);
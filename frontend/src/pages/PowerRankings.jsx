@@ -5,10 +5,13 @@ import { Card, CardContent, CardHeader, CardTitle } from '../components/ui/card'
 import TeamLogo from '../components/TeamLogo';
 
 import API from '../lib/api';
+import { useLeagueEvents } from '../hooks/use-league-events';
 
 const PowerRankings = () => {
   const [rankings, setRankings] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [revision, setRevision] = useState(0);
+  useLeagueEvents(['rankings', 'season_started'], () => setRevision((r) => r + 1));
 
   useEffect(() => {
     const fetchRankings = async () => {
@@ -22,7 +25,7 @@ const PowerRankings = () => {
       }
     };
     fetchRankings();
-  }, []);
+  }, [revision]);
 
   const getTrendIcon = (trend, prevRank, currentRank) => {
     const diff = prevRank - currentRank;
@@ -128,7 +131,9 @@ const PowerRankings = () => {
                       />
                       <div>
                         <div className="font-heading font-bold text-white">{team.team_name}</div>
-                        <div className="font-body text-xs text-white/40">{team.record}</div>
+                        <div className="font-body text-xs text-white/40">
+                          {team.record}{team.elo != null && ` · ${Math.round(team.elo)} Elo`}
+                        </div>
                       </div>
                     </div>
 
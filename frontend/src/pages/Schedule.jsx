@@ -18,12 +18,9 @@ const Schedule = () => {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [scheduleRes, teamsRes] = await Promise.all([
-          axios.get(`${API}/schedule`),
-          axios.get(`${API}/teams`)
-        ]);
+        const scheduleRes = await axios.get(`${API}/schedule?include=teams`);
         setScheduleData(scheduleRes.data);
-        setTeams(teamsRes.data);
+        setTeams(Object.values(scheduleRes.data.teams || {}));
         // Set total weeks from data and select the latest week with games
         const maxWeek = scheduleRes.data.total_weeks || Math.max(...(scheduleRes.data.games || []).map(g => g.week), 1);
         setTotalWeeks(maxWeek);
@@ -8,12 +8,15 @@ import { Card, CardContent, CardHeader, CardTitle } from '../components/ui/card'
 import { Badge } from '../components/ui/badge';
 import TeamLogo from '../components/TeamLogo';
 import API from '../lib/api';
+import { useLeagueEvents } from '../hooks/use-league-events';
 
 const Standings = () => {
   const [standings, setStandings] = useState({ grand_central: [], ridge: [], league_structure: null });
   const [teams, setTeams] = useState([]);
   const [loading, setLoading] = useState(true);
   const [activeConference, setActiveConference] = useState('all');
+  const [revision, setRevision] = useState(0);
+  useLeagueEvents(['standings', 'season_started'], () => setRevision((r) => r + 1));
 
   useEffect(() => {
     const fetchStandings = async () => {
@@ -34,7 +37,7 @@ const Standings = () => {
       }
     };
     fetchStandings();
-  }, []);
+  }, [revision]);
 
   const getPlayoffBadge = (status) => {
     if (!status) return null;
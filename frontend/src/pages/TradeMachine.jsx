@@ -73,56 +73,29 @@ const TradeMachine = () => {
     return Math.round(value);
   };
 
-  const analyzeTrade = () => {
-    const team1Value = team1Offers.reduce((sum, p) => sum + calculatePlayerValue(p), 0);
-    const team2Value = team2Offers.reduce((sum, p) => sum + calculatePlayerValue(p), 0);
-    
-    const difference = team1Value - team2Value;
-    const percentDiff = team1Value > 0 ? Math.abs(difference / team1Value * 100) : 0;
-    
-    let verdict, grade, winner;
-    
-    if (percentDiff < 5) {
-      verdict = "Fair Trade";
-      grade = "A";
-      winner = null;
-    } else if (percentDiff < 15) {
-      verdict = "Slightly Uneven";
-      grade = "B";
-      winner = difference > 0 ? 2 : 1;
-    } else if (percentDiff < 30) {
-      verdict = "Unbalanced Trade";
-      grade = "C";
-      winner = difference > 0 ? 2 : 1;
-    } else {
-      verdict = "Lopsided Trade";
-      grade = "F";
-      winner = difference > 0 ? 2 : 1;
+  const analyzeTrade = async () => {
+    try {
+      const { data } = await axios.post(`${API}/trades/evaluate`, {
+        team1_id: team1.id,
+        team2_id: team2.id,
+        team1_sends: team1Offers.map(p => p.id),
+        team2_sends: team2Offers.map(p => p.id),
+      });
+      const [side1, side2] = data.teams;
+      setAnalysis({
+        team1Value: side1.value_sent,
+        team2Value: side2.value_sent,
+        difference: data.difference,
+        percentDiff: data.percent_diff,
+        verdict: data.verdict,
+        grade: data.grade,
+        winner: data.winner === null ? null : data.winner === side1.team_id ? 1 : 2,
+        team1Needs: side1.needs,
+        team2Needs: side2.needs,
+      });
+    } catch (err) {
+      console.error(err);
     }
-
-    setAnalysis({
-      team1Value,
-      team2Value,
-      difference: Math.abs(difference),
-      percentDiff,
-      verdict,
-      grade,
-      winner,
-      team1Needs: getTeamNeeds(team1, team1Players.filter(p => !team1Offers.includes(p)).concat(team2Offers)),
-      team2Needs: getTeamNeeds(team2, team2Players.filter(p => !team2Offers.includes(p)).concat(team1Offers)),
-    });
-  };
-
-  const getTeamNeeds = (team, roster) => {
-    const positions = { QB: 0, RB: 0, WR: 0, TE: 0, DEF: 0, K: 0 };
-    roster.forEach(p => { if (positions[p.position] !== undefined) positions[p.position]++; });
-    
-    const needs = [];
-    if (positions.QB < 1) needs.push('QB');
-    if (positions.RB < 2) needs.push('RB');
-    if (positions.WR < 2) needs.push('WR');
-    if (positions.DEF < 1) needs.push('DEF');
-    return needs;
   };
 
   const addToOffer = (player, team) => {
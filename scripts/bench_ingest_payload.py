@@ -0,0 +1,86 @@
+"""Benchmark the Roblox game submission formats for a full roster.
+
+Compares the nested /api/game payload with the columnar /api/game/compact one,
+plain and gzip-encoded, and times parsing plus stat mapping for each.
+
+Usage: python scripts/bench_ingest_payload.py [iterations]
+"""
+import gzip
+import sys
+import time
+from pathlib import Path
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.server import (  # noqa: E402
+    ROBLOX_STAT_FIELDS,
+    RobloxCompactPayload,
+    RobloxGamePayload,
+    compact_stat_lines,
+    resolve_compact_columns,
+    roblox_stat_lines,
+)
+
+PLAYERS_PER_SIDE = 40
+COLUMNS = [
+    f"{category.title()}/{stat.title()}"
+    for category, stats in ROBLOX_STAT_FIELDS.items()
+    for stat in stats
+]
+
+
+def nested_side(side: str) -> dict:
+    players = {}
+    for i in range(PLAYERS_PER_SIDE):
+        n = 0
+        categories = {}
+        for category, stats in ROBLOX_STAT_FIELDS.items():
+            categories[category.title()] = {}
+            for stat in stats:
+                categories[category.title()][stat.title()] = float((i + n) % 9)
+                n += 1
+        players[f"{side}_player_{i}"] = categories
+    return players
+
+
+def compact_side(side: str) -> dict:
+    width = sum(len(stats) for stats in ROBLOX_STAT_FIELDS.values())
+    return {f"{side}_player_{i}": [float((i + n) % 9) for n in range(width)] for i in range(PLAYERS_PER_SIDE)}
+
+
+def header() -> dict:
+    return {"week": 1, "home_team": "Home", "away_team": "Away", "home_score": 21, "away_score": 14}
+
+
+def ingest_nested(body: bytes):
+    payload = RobloxGamePayload(**orjson.loads(body))
+    return roblox_stat_lines(payload.home_stats), roblox_stat_lines(payload.away_stats)
+
+
+def ingest_compact(body: bytes):
+    payload = RobloxCompactPayload(**orjson.loads(body))
+    fields = resolve_compact_columns(payload.columns)
+    return compact_stat_lines(fields, payload.home), compact_stat_lines(fields, payload.away)
+
+
+def bench(fn, body: bytes, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(body)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main(iterations: int = 200):
+    nested = orjson.dumps({**header(), "home_stats": nested_side("home"), "away_stats": nested_side("away")})
+    compact = orjson.dumps({**header(), "columns": COLUMNS, "home": compact_side("home"), "away": compact_side("away")})
+    assert ingest_nested(nested) == ingest_compact(compact)
+
+    print(f"{PLAYERS_PER_SIDE * 2} players, {len(COLUMNS)} stats each")
+    print(f"nested:  {len(nested):>7} bytes, gzip {len(gzip.compress(nested)):>6} bytes, ingest {bench(ingest_nested, nested, iterations):.3f} ms")
+    print(f"compact: {len(compact):>7} bytes, gzip {len(gzip.compress(compact)):>6} bytes, ingest {bench(ingest_compact, compact, iterations):.3f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
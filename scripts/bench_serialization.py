@@ -0,0 +1,83 @@
+"""Benchmark response serialization for a /api/players?limit=100 payload.
+
+Compares the previous path (serialize_doc-style copy, jsonable_encoder and the
+stdlib JSONResponse encoder) with the orjson path the player endpoints now use.
+
+Usage: python scripts/bench_serialization.py [iterations]
+"""
+import json
+import sys
+import time
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+PLAYER_COUNT = 100
+
+
+def make_player(i: int) -> dict:
+    return {
+        "_id": f"{i:024x}",
+        "id": f"p{i}",
+        "roblox_id": str(100000 + i),
+        "roblox_username": f"player_{i}",
+        "name": f"player_{i}",
+        "position": ["QB", "RB", "WR", "DEF"][i % 4],
+        "team": "Team",
+        "team_id": f"tm{i % 12}",
+        "is_elite": i % 10 == 0,
+        "image": f"https://tr.rbxcdn.com/{i}/150/150/AvatarHeadshot/Png",
+        "games_played": 8,
+        "fantasy_points": 100.5 + i,
+        "total_touchdowns": i % 7,
+        "passing": {"completions": 120, "attempts": 180, "yards": 1500, "touchdowns": 12, "interceptions": 3, "rating": 98.4, "completion_pct": 66.7, "average": 8.3, "longest": 64},
+        "rushing": {"attempts": 40, "yards": 210, "touchdowns": 2, "yards_per_carry": 5.2, "fumbles": 1, "twenty_plus": 3, "longest": 31},
+        "receiving": {"receptions": 30, "yards": 410, "touchdowns": 4, "drops": 2, "longest": 48},
+        "defense": {"tackles": 12, "tackles_for_loss": 2, "sacks": 1.5, "swat": 3, "interceptions": 1, "pass_deflections": 4, "td": 0, "safeties": 0},
+        "weekly_scores": [{"week": w, "points": 12.5 + w} for w in range(1, 9)],
+        "team_logo": "/uploads/team_logo.png",
+        "team_color": "#3B82F6",
+        "team_abbreviation": "TM",
+    }
+
+
+def serialize_doc(doc):
+    """The removed helper: recursive copy that drops _id"""
+    if isinstance(doc, list):
+        return [serialize_doc(d) for d in doc]
+    if isinstance(doc, dict):
+        return {k: serialize_doc(v) for k, v in doc.items() if k != "_id"}
+    return doc
+
+
+def before(players):
+    content = jsonable_encoder(serialize_doc(players))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def after(players):
+    # _id is excluded by the Mongo projection, so the documents are encoded as-is
+    return orjson.dumps(players)
+
+
+def bench(fn, payload, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(payload)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main(iterations: int = 200):
+    raw = [make_player(i) for i in range(PLAYER_COUNT)]
+    projected = [{k: v for k, v in p.items() if k != "_id"} for p in raw]
+    assert orjson.loads(before(raw)) == orjson.loads(after(projected))
+    before_ms = bench(before, raw, iterations)
+    after_ms = bench(after, projected, iterations)
+    print(f"/api/players?limit={PLAYER_COUNT} payload: {len(after(projected))} bytes")
+    print(f"before (serialize_doc + jsonable_encoder + json): {before_ms:.3f} ms")
+    print(f"after  (projection + orjson):                    {after_ms:.3f} ms")
+    print(f"speedup: {before_ms / after_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -11,3 +11,10 @@ echo "Syncing build to /static..."
 rm -rf static
 mkdir -p static
 cp -R frontend/build/* static/
+
+echo "Precompressing static assets..."
+if command -v python3 >/dev/null 2>&1; then
+  python3 scripts/precompress_static.py static
+else
+  echo "python3 not available; skipping precompression"
+fi
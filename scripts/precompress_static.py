@@ -0,0 +1,55 @@
+"""Write .gz and .br siblings next to compressible files in the frontend build.
+
+The backend serves these directly when the client accepts them, so the bundle
+is compressed once at build time instead of on every request.
+
+Usage: python scripts/precompress_static.py [static_dir]
+"""
+import gzip
+import sys
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; only .gz siblings are written
+    brotli = None
+
+COMPRESSIBLE_SUFFIXES = {".js", ".css", ".html", ".json", ".svg", ".map", ".txt", ".ico", ".xml"}
+MIN_SIZE = 1024
+
+
+def compress_file(path: Path) -> int:
+    """Write missing or stale siblings for one file; returns how many were written"""
+    data = path.read_bytes()
+    written = 0
+    encoders = [(".gz", lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.append((".br", lambda raw: brotli.compress(raw, quality=11)))
+    for suffix, encode in encoders:
+        target = path.with_name(path.name + suffix)
+        if target.exists() and target.stat().st_mtime >= path.stat().st_mtime:
+            continue
+        compressed = encode(data)
+        # Serving a sibling that is not smaller would only cost the client time
+        if len(compressed) >= len(data):
+            continue
+        target.write_bytes(compressed)
+        written += 1
+    return written
+
+
+def main(static_dir: str = "static") -> int:
+    root = Path(static_dir)
+    if not root.is_dir():
+        print(f"Static directory not found: {root}")
+        return 1
+    written = 0
+    for path in root.rglob("*"):
+        if path.is_file() and path.suffix in COMPRESSIBLE_SUFFIXES and path.stat().st_size >= MIN_SIZE:
+            written += compress_file(path)
+    print(f"Precompressed {written} files under {root}" + ("" if brotli else " (brotli not installed, gzip only)"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:2]))
@@ -46,6 +46,11 @@ local STAT_DEFINITIONS = {
 	}
 }
 
+-- Live game streaming: stat changes are batched and sent every LIVE_FLUSH_SECONDS
+-- so a game in progress can be followed and a failed final submit loses nothing
+local LIVE_ENABLED = true
+local LIVE_FLUSH_SECONDS = 3
+
 local SUBMISSION_STATS = {
 	passing = {"Completions", "Attempts", "Yards", "Touchdowns", "Interceptions", "Longest"},
 	rushing = {"Attempts", "Yards", "Touchdowns", "Fumbles", "Longest"},
@@ -60,6 +65,14 @@ local SUBMISSION_STATS = {
 local StatsManager = {}
 local statsEnabled = false
 
+local liveGame = {
+	id = nil,
+	seq = 0,
+	pending = {},
+	inFlight = nil,
+	flushing = false
+}
+
 local submissionData = {
 	week = 1,
 	home_team = "Home",
@@ -308,6 +321,130 @@ local function syncSubmissionData(category, userId)
 	teamStats[playerName][category] = apiStats
 end
 
+--============================================================================--
+--                        COMPACT SUBMISSION                                  --
+--============================================================================--
+
+-- Columnar payload for /api/game/compact: one header of "Category/Stat"
+-- columns and one numeric row per player, in this category order
+local COMPACT_CATEGORIES = {"passing", "rushing", "receiving", "defense"}
+
+local function buildCompactColumns()
+	local columns = {}
+	for _, category in ipairs(COMPACT_CATEGORIES) do
+		for _, statName in ipairs(SUBMISSION_STATS[category]) do
+			table.insert(columns, toPascalCase(category) .. "/" .. statName)
+		end
+	end
+	return columns
+end
+
+local function buildCompactRows(teamStats)
+	local rows = {}
+	local count = 0
+	for playerName, categories in pairs(teamStats) do
+		local row = {}
+		for _, category in ipairs(COMPACT_CATEGORIES) do
+			local stats = categories[toPascalCase(category)] or categories[category] or {}
+			for _, statName in ipairs(SUBMISSION_STATS[category]) do
+				table.insert(row, tonumber(stats[statName]) or 0)
+			end
+		end
+		rows[playerName] = row
+		count += 1
+	end
+	return rows, count
+end
+
+--============================================================================--
+--                            LIVE GAME                                       --
+--============================================================================--
+
+local function liveRequest(method, path, body)
+	local success, response = pcall(function()
+		return HttpService:RequestAsync({
+			Url = getApiRoot() .. path,
+			Method = method,
+			Headers = {
+				["Content-Type"] = "application/json"
+			},
+			Body = body and HttpService:JSONEncode(body) or nil
+		})
+	end)
+	if success and response and response.Success then
+		return true, HttpService:JSONDecode(response.Body)
+	end
+	return false, response
+end
+
+-- true if the server still holds the session, false if it is gone, nil if unreachable
+local function liveGameOpen(id)
+	local ok, response = liveRequest("GET", "live/games/" .. id)
+	if ok then
+		return true
+	end
+	if type(response) == "table" and response.StatusCode == 404 then
+		return false
+	end
+	return nil
+end
+
+local function getPlayerSide(userId)
+	local teamKey = getPlayerTeam(userId)
+	local homeTeam = TeamManager:getHome()
+	local awayTeam = TeamManager:getAway()
+	if homeTeam and teamKey == homeTeam.Name then return "home" end
+	if awayTeam and teamKey == awayTeam.Name then return "away" end
+	return nil
+end
+
+local function queueLiveDelta(category, userId, statKey, value, op)
+	if not liveGame.id then return end
+	local categoryKey = category:lower()
+	if not SUBMISSION_STATS[categoryKey] or not table.find(SUBMISSION_STATS[categoryKey], statKey) then
+		return
+	end
+	local side = getPlayerSide(userId)
+	if not side then return end
+
+	local player = Players:GetPlayerByUserId(userId)
+	table.insert(liveGame.pending, {
+		side = side,
+		player = player and player.Name or tostring(userId),
+		category = categoryKey,
+		stat = statKey,
+		value = value,
+		op = op
+	})
+end
+
+-- Sends queued deltas as one batch. A failed batch is kept with its seq and
+-- resent as-is, so the server applies it exactly once.
+local function flushLiveDeltas()
+	if not liveGame.id or liveGame.flushing then return true end
+	if not liveGame.inFlight then
+		if #liveGame.pending == 0 then return true end
+		liveGame.seq += 1
+		liveGame.inFlight = {
+			seq = liveGame.seq,
+			deltas = liveGame.pending,
+			home_score = submissionData.home_score,
+			away_score = submissionData.away_score
+		}
+		liveGame.pending = {}
+	end
+
+	liveGame.flushing = true
+	local ok = liveRequest("POST", "live/games/" .. liveGame.id .. "/deltas", liveGame.inFlight)
+	liveGame.flushing = false
+	if ok then
+		liveGame.inFlight = nil
+	else
+		warn("[StatsManager] Live update failed, will retry batch " .. tostring(liveGame.seq))
+	end
+	return ok
+end
+
 --============================================================================--
 --                          PUBLIC API                                        --
 --============================================================================--
@@ -332,14 +469,12 @@ function StatsManager:AddStatLine(category, userId, statKey, value)
 		return
 	end
 
-	if statKey == "Yards" and value then
-		statInstance.Value += value
-	else
-		statInstance.Value += 1
-	end
+	local delta = (statKey == "Yards" and value) and value or 1
+	statInstance.Value += delta
 
 	updateCalculatedStats(category, userId)
 	syncSubmissionData(category, userId)
+	queueLiveDelta(category, userId, statKey, delta, "add")
 end
 
 function StatsManager:GetStatValue(category, userId, statKey)
@@ -373,6 +508,7 @@ function StatsManager:SetStatValue(category, userId, statKey, value)
 
 	updateCalculatedStats(category, userId)
 	syncSubmissionData(category, userId)
+	queueLiveDelta(category, userId, statKey, value, "set")
 end
 
 function StatsManager:RefreshAllPlayerTeams()
@@ -424,6 +560,41 @@ function StatsManager:SetGameDate(dateString)
 	submissionData.game_date = dateString
 end
 
+function StatsManager:StartLiveGame()
+	if not LIVE_ENABLED then return false end
+	local ok, result = liveRequest("POST", "live/games", {
+		week = submissionData.week,
+		home_team = submissionData.home_team,
+		away_team = submissionData.away_team,
+		game_date = submissionData.game_date
+	})
+	if not ok then
+		warn("[StatsManager] Could not open live game; stats will be submitted at the end only")
+		return false
+	end
+
+	liveGame.id = result.id
+	liveGame.seq = 0
+	liveGame.pending = {}
+	liveGame.inFlight = nil
+	print("[StatsManager] Live game opened: " .. liveGame.id)
+
+	local sessionId = liveGame.id
+	task.spawn(function()
+		while liveGame.id == sessionId do
+			task.wait(LIVE_FLUSH_SECONDS)
+			if liveGame.id == sessionId then
+				flushLiveDeltas()
+			end
+		end
+	end)
+	return true
+end
+
+function StatsManager:GetLiveGameId()
+	return liveGame.id
+end
+
 function StatsManager:GetAPIUrl()
 	return API_URL
 end
@@ -507,6 +678,10 @@ function StatsManager:GetLeaderboard(category, statName, limit)
 end
 
 function StatsManager:Reset()
+	liveGame.id = nil
+	liveGame.pending = {}
+	liveGame.inFlight = nil
+
 	submissionData = {
 		week = submissionData.week,
 		home_team = "Home",
@@ -569,6 +744,37 @@ function StatsManager:Submit()
 
 	rebuildSubmissionData()
 
+	-- With a live session the server already holds the box score: flush what is
+	-- left and finalize. Fall back to the full payload if that fails; it carries
+	-- the session id so the server closes the session instead of keeping it open.
+	local liveGameId = nil
+	if liveGame.id then
+		while liveGame.flushing do
+			task.wait()
+		end
+		local flushed = flushLiveDeltas() and flushLiveDeltas()
+		if flushed then
+			local ok, result = liveRequest("POST", "live/games/" .. liveGame.id .. "/finalize", {
+				home_score = submissionData.home_score,
+				away_score = submissionData.away_score,
+				player_of_game = submissionData.player_of_game
+			})
+			if ok then
+				print("[StatsManager] Live game finalized")
+				liveGame.id = nil
+				return true, HttpService:JSONEncode(result)
+			end
+		end
+		liveGameId = liveGame.id
+		liveGame.id = nil
+		if liveGameOpen(liveGameId) == false then
+			-- The finalize landed but its response was lost; submitting again would record the game twice
+			print("[StatsManager] Live game was already finalized")
+			return true, "Live game already finalized"
+		end
+		warn("[StatsManager] Live finalize failed, submitting full payload instead")
+	end
+
 	if not submissionData.week or submissionData.week < 1 then
 		warn("[StatsManager] Invalid week number:", submissionData.week)
 		return false, "Invalid week number"
@@ -584,25 +790,8 @@ function StatsManager:Submit()
 		warn("[StatsManager] Player of game is not set")
 	end
 
-	local homeStatsDict = {}
-	for key, value in pairs(submissionData.home_stats) do
-		homeStatsDict[key] = value
-	end
-
-	local awayStatsDict = {}
-	for key, value in pairs(submissionData.away_stats) do
-		awayStatsDict[key] = value
-	end
-
-	local hasHomeStats = next(homeStatsDict) ~= nil
-	local hasAwayStats = next(awayStatsDict) ~= nil
-
-	if not hasHomeStats then
-		homeStatsDict["__empty__"] = true
-	end
-	if not hasAwayStats then
-		awayStatsDict["__empty__"] = true
-	end
+	local homeRows, homeCount = buildCompactRows(submissionData.home_stats)
+	local awayRows, awayCount = buildCompactRows(submissionData.away_stats)
 
 	local dataToSubmit = {
 		week = submissionData.week,
@@ -611,10 +800,18 @@ function StatsManager:Submit()
 		home_score = submissionData.home_score,
 		away_score = submissionData.away_score,
 		player_of_game = submissionData.player_of_game,
-		home_stats = homeStatsDict,
-		away_stats = awayStatsDict
+		live_game_id = liveGameId,
+		columns = buildCompactColumns()
 	}
 
+	-- An empty Lua table encodes as [], so sides without players are left out
+	if homeCount > 0 then
+		dataToSubmit.home = homeRows
+	end
+	if awayCount > 0 then
+		dataToSubmit.away = awayRows
+	end
+
 	if submissionData.game_date then
 		dataToSubmit.game_date = submissionData.game_date
 	end
@@ -622,14 +819,6 @@ function StatsManager:Submit()
 	local jsonData
 	local encodeSuccess, encodeError = pcall(function()
 		jsonData = HttpService:JSONEncode(dataToSubmit)
-
-		if not hasHomeStats or not hasAwayStats then
-			jsonData = jsonData:gsub('"%s*__empty__"%s*:%s*true%s*,?%s*', '')
-			jsonData = jsonData:gsub(',%s*"%s*__empty__"%s*:%s*true', '')
-			jsonData = jsonData:gsub(',%s*,', ',')
-			jsonData = jsonData:gsub(',%s*}', '}')
-			jsonData = jsonData:gsub(',%s*]', ']')
-		end
 	end)
 
 	if not encodeSuccess then
@@ -643,7 +832,7 @@ function StatsManager:Submit()
 	for attempt = 1, maxRetries do
 		success, response = pcall(function()
 			return HttpService:RequestAsync({
-				Url = API_URL,
+				Url = getApiRoot() .. "game/compact",
 				Method = "POST",
 				Headers = {
 					["Content-Type"] = "application/json"
@@ -665,6 +854,12 @@ function StatsManager:Submit()
 				local statusCode = response.StatusCode or "?"
 				warn("[StatsManager] HTTP " .. tostring(statusCode) .. ": " .. statusMsg)
 
+				if statusCode == 409 and liveGameId then
+					-- An earlier attempt already saved the game and closed the live session
+					print("[StatsManager] Live game was already recorded")
+					return true, response.Body
+				end
+
 				if statusCode == 404 then
 					warn("[StatsManager] API endpoint not found (404). Please check:")
 					warn("[StatsManager] 1. Is the backend deployed? Current URL: " .. API_URL)
@@ -10,6 +10,8 @@ Tests for all backend endpoints including:
 import pytest
 import requests
 import os
+import json
+import gzip
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', 'http://localhost:8001').rstrip('/')
 ADMIN_KEY = "BacconIsCool1@"
@@ -162,6 +164,57 @@ class TestPlayers:
         # weekly_scores contains the weekly stats data
         assert isinstance(data["weekly_scores"], list)
     
+    def test_get_players_batch(self):
+        """Test batch lookup keeps request order and reports missing ids"""
+        response = requests.get(f"{BASE_URL}/api/players/batch?ids=p2,nonexistent,p1")
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert [p["id"] for p in data["players"]] == ["p2", "p1"]
+        assert data["missing"] == ["nonexistent"]
+        for player in data["players"]:
+            assert "weekly_scores" in player
+    
+    def test_player_percentiles(self):
+        """Test percentiles cover every stat league-wide and within the position"""
+        response = requests.get(f"{BASE_URL}/api/players/p1/percentiles")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["player_id"] == "p1"
+        fantasy = data["stats"]["fantasy_points"]
+        assert 0 <= fantasy["league_percentile"] <= 100
+        assert 0 <= fantasy["position_percentile"] <= 100
+        assert "league_z" in fantasy and "position_z" in fantasy
+
+    def test_compare_players(self):
+        """Test comparison vectors line up with the requested stats"""
+        response = requests.get(f"{BASE_URL}/api/players/compare?ids=p1,p2,nonexistent&stats=fantasy_points,rushing.yards")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["stats"] == ["fantasy_points", "rushing.yards"]
+        assert [p["id"] for p in data["players"]] == ["p1", "p2"]
+        assert data["missing"] == ["nonexistent"]
+        for player in data["players"]:
+            assert len(player["values"]) == len(player["percentiles"]) == len(player["z_scores"]) == 2
+
+    def test_compare_rate_stats_unrated_without_attempts(self):
+        """Test rate stats are null for players with no attempts"""
+        response = requests.get(f"{BASE_URL}/api/players/compare?ids=p1,p2&stats=passing.attempts,passing.rating")
+        assert response.status_code == 200
+        for player in response.json()["players"]:
+            attempts, rating = player["values"]
+            if attempts:
+                assert rating is not None and player["percentiles"][1] is not None
+            else:
+                assert rating is None and player["percentiles"][1] is None and player["z_scores"][1] is None
+
+    def test_compare_players_rejects_unknown_stat(self):
+        """Test unknown stat names are rejected"""
+        response = requests.get(f"{BASE_URL}/api/players/compare?ids=p1&stats=not_a_stat")
+        assert response.status_code == 400
+
     def test_get_player_not_found(self):
         """Test 404 for non-existent player"""
         response = requests.get(f"{BASE_URL}/api/players/nonexistent")
@@ -195,6 +248,78 @@ class TestPlayers:
         assert "position" in data
         assert "fantasy_points" in data
         assert data["name"] == "n4w"
+    
+    def test_players_cursor_pagination(self):
+        """Test keyset pagination walks pages without overlap"""
+        response = requests.get(f"{BASE_URL}/api/players?limit=2&paged=true")
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert "players" in data
+        assert "next_cursor" in data
+        first_ids = [p["id"] for p in data["players"]]
+        if data["next_cursor"]:
+            response = requests.get(f"{BASE_URL}/api/players?limit=2&paged=true&cursor={data['next_cursor']}")
+            assert response.status_code == 200
+            second_ids = [p["id"] for p in response.json()["players"]]
+            assert not set(first_ids) & set(second_ids)
+    
+    def test_players_invalid_cursor(self):
+        """Test malformed cursor returns 400"""
+        response = requests.get(f"{BASE_URL}/api/players?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    def test_players_list_shape_without_paged(self):
+        """Test an empty cursor leaves the legacy list response unchanged"""
+        response = requests.get(f"{BASE_URL}/api/players?limit=2&cursor=")
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
+        if "X-Next-Cursor" in response.headers:
+            response = requests.get(f"{BASE_URL}/api/players?limit=2&cursor={response.headers['X-Next-Cursor']}")
+            assert isinstance(response.json(), list)
+
+    def test_players_limit_bounds(self):
+        """Test limit must be between 1 and 200"""
+        for limit in (0, -1, 201):
+            response = requests.get(f"{BASE_URL}/api/players?limit={limit}&paged=true")
+            assert response.status_code == 422
+    
+    def test_players_card_fields(self):
+        """Test card preset returns only slim fields"""
+        response = requests.get(f"{BASE_URL}/api/players?limit=12&fields=card")
+        assert response.status_code == 200
+        data = response.json()
+        
+        for player in data:
+            assert "roblox_username" in player
+            assert "fantasy_points" in player
+            assert "passing" not in player
+            assert "weekly_scores" not in player
+    
+    def test_player_sparse_fields(self):
+        """Test explicit field list with a nested stat path"""
+        response = requests.get(f"{BASE_URL}/api/players/p1?fields=id,name,passing.yards")
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert set(data.keys()) == {"id", "name", "passing"}
+        assert set(data["passing"].keys()) <= {"yards"}
+    
+    def test_player_search_autocomplete(self):
+        """Test in-memory autocomplete search ranks exact/prefix matches first"""
+        response = requests.get(f"{BASE_URL}/api/players/search?q=n4&limit=5")
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert "results" in data
+        assert len(data["results"]) <= 5
+        for player in data["results"]:
+            assert "n4" in (player["roblox_username"] or "").lower() or "n4" in (player["roblox_id"] or "").lower()
+    
+    def test_players_unknown_field(self):
+        """Test unknown field returns 400"""
+        response = requests.get(f"{BASE_URL}/api/players?fields=password_hash")
+        assert response.status_code == 400
 
 
 class TestTeams:
@@ -300,6 +425,27 @@ class TestSchedule:
         # All games should be from week 1
         for game in data["games"]:
             assert game["week"] == 1
+    
+    def test_schedule_include_teams(self):
+        """Test schedule embeds each referenced team once"""
+        response = requests.get(f"{BASE_URL}/api/schedule?include=teams")
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert "teams" in data
+        for game in data["games"]:
+            assert game["home_team_id"] in data["teams"]
+            assert game["away_team_id"] in data["teams"]
+    
+    def test_schedule_columnar(self):
+        """Test columnar schedule returns parallel arrays"""
+        response = requests.get(f"{BASE_URL}/api/schedule?format=columnar")
+        assert response.status_code == 200
+        data = response.json()
+        
+        columns = data["columns"]
+        assert len(columns["id"]) == data["count"]
+        assert len(columns["week"]) == len(columns["home_team_id"]) == data["count"]
 
 
 class TestStatLeaders:
@@ -330,6 +476,192 @@ class TestStatLeaders:
                 assert "team" in player
 
 
+class TestLeaders:
+    """Generic leaderboard endpoint tests"""
+    
+    def test_leaders_for_nested_stat(self):
+        """Test leaderboard for a nested stat path filtered by position"""
+        response = requests.get(f"{BASE_URL}/api/leaders?stat=rushing.yards&position=RB&limit=3")
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["stat"] == "rushing.yards"
+        assert len(data["leaders"]) <= 3
+        values = [leader["value"] for leader in data["leaders"]]
+        assert values == sorted(values, reverse=True)
+        for leader in data["leaders"]:
+            assert leader["position"] == "RB"
+    
+    def test_leaders_unknown_stat(self):
+        """Test unknown stat path returns 400"""
+        response = requests.get(f"{BASE_URL}/api/leaders?stat=passing.password")
+        assert response.status_code == 400
+
+    def test_leaders_reject_unindexed_stat(self):
+        """Test stats without a leaderboard index are refused rather than sorted in memory"""
+        for path in ("leaders", "leaders/career"):
+            response = requests.get(f"{BASE_URL}/api/{path}?stat=defense.tackles")
+            assert response.status_code == 400
+    
+    def test_career_leaders(self):
+        """Test career leaderboard is ordered and carries season counts"""
+        response = requests.get(f"{BASE_URL}/api/leaders/career?stat=fantasy_points&limit=5")
+        assert response.status_code == 200
+        data = response.json()
+        
+        values = [leader["value"] for leader in data["leaders"]]
+        assert values == sorted(values, reverse=True)
+        for leader in data["leaders"]:
+            assert "seasons" in leader
+            assert "id" in leader["player"]
+    
+    def test_player_career_covers_current_season(self):
+        """Test career totals are at least the running season's totals"""
+        players = requests.get(f"{BASE_URL}/api/players", params={"limit": 1}).json()
+        if not players:
+            pytest.skip("No players available")
+        player = players[0]
+        response = requests.get(f"{BASE_URL}/api/players/{player['id']}/career")
+        assert response.status_code == 200
+        career = response.json()
+        
+        assert career["player_id"] == player["id"]
+        assert career["fantasy_points"] >= player["fantasy_points"]
+        assert career["games_played"] >= player.get("games_played", 0)
+
+
+class TestEvents:
+    """Server-Sent Events stream tests"""
+
+    def test_events_stream_opens(self):
+        """Test /api/events is an uncompressed event stream"""
+        with requests.get(f"{BASE_URL}/api/events", stream=True, timeout=10) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            assert "content-encoding" not in response.headers
+            first = next(response.iter_lines())
+            assert first.startswith(b"retry:")
+
+    def test_events_stale_id_resyncs(self):
+        """Test reconnecting with an unknown Last-Event-ID asks the client to resync"""
+        with requests.get(f"{BASE_URL}/api/events", headers={"Last-Event-ID": "stale-1"}, stream=True, timeout=10) as response:
+            lines = response.iter_lines()
+            assert next(lines).startswith(b"retry:")
+            assert next(lines) == b""
+            assert next(lines) == b"event: resync"
+
+
+class TestLiveGames:
+    """Live game session tests"""
+
+    def test_live_game_deltas_apply_once(self):
+        """Test deltas accumulate into the box score and retried batches are ignored"""
+        response = requests.post(f"{BASE_URL}/api/live/games", json={"week": 99, "home_team": "Home Test", "away_team": "Away Test"})
+        assert response.status_code == 200
+        game_id = response.json()["id"]
+
+        batch = {
+            "seq": 1,
+            "home_score": 7,
+            "deltas": [
+                {"side": "home", "player": "LiveTester", "category": "Passing", "stat": "Yards", "value": 30},
+                {"side": "home", "player": "LiveTester", "category": "Passing", "stat": "Touchdowns"}
+            ]
+        }
+        assert requests.post(f"{BASE_URL}/api/live/games/{game_id}/deltas", json=batch).json()["applied"] is True
+        assert requests.post(f"{BASE_URL}/api/live/games/{game_id}/deltas", json=batch).json()["applied"] is False
+
+        box = requests.get(f"{BASE_URL}/api/live/games/{game_id}").json()
+        assert box["home_score"] == 7
+        line = box["players"][0]
+        assert line["pass_yards"] == 30
+        assert line["pass_tds"] == 1
+
+        response = requests.delete(f"{BASE_URL}/api/live/games/{game_id}", headers={"X-Admin-Key": ADMIN_KEY})
+        assert response.status_code == 200
+        assert requests.get(f"{BASE_URL}/api/live/games/{game_id}").status_code == 404
+
+    def test_live_game_rejects_unknown_stat(self):
+        """Test deltas naming a stat the stats manager never submits are rejected"""
+        game_id = requests.post(f"{BASE_URL}/api/live/games", json={"week": 99, "home_team": "Home Test", "away_team": "Away Test"}).json()["id"]
+        response = requests.post(
+            f"{BASE_URL}/api/live/games/{game_id}/deltas",
+            json={"seq": 1, "deltas": [{"side": "home", "player": "LiveTester", "category": "Passing", "stat": "Rating"}]}
+        )
+        assert response.status_code == 400
+        requests.delete(f"{BASE_URL}/api/live/games/{game_id}", headers={"X-Admin-Key": ADMIN_KEY})
+
+    def test_fallback_submission_for_closed_live_game_rejected(self):
+        """Test a full submission standing in for a closed live session is not recorded again"""
+        response = requests.post(
+            f"{BASE_URL}/api/game/compact",
+            json={"week": 99, "home_team": "Home Test", "away_team": "Away Test", "live_game_id": "closed-session", "columns": []}
+        )
+        assert response.status_code == 409
+
+
+class TestCompactSubmission:
+    """Compact and gzip-encoded game submission tests"""
+
+    def test_compact_unknown_column_gzip(self):
+        """Test a gzip-encoded compact payload is inflated and its columns validated"""
+        payload = {"week": 1, "home_team": "Home Test", "away_team": "Away Test", "columns": ["Passing/Rating"], "home": {"TestPlayer1": [99.5]}}
+        response = requests.post(
+            f"{BASE_URL}/api/game/compact",
+            data=gzip.compress(json.dumps(payload).encode()),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        )
+        assert response.status_code == 400
+        assert "Passing/Rating" in response.json()["detail"]
+
+    def test_compact_row_width_mismatch(self):
+        """Test rows must have one value per column"""
+        payload = {"week": 1, "home_team": "Home Test", "away_team": "Away Test", "columns": ["pass_yards", "Passing/Touchdowns"], "home": {"TestPlayer1": [120]}}
+        response = requests.post(f"{BASE_URL}/api/game/compact", json=payload)
+        assert response.status_code == 400
+
+    def test_malformed_gzip_body(self):
+        """Test a body labelled gzip that is not gzip is rejected"""
+        response = requests.post(
+            f"{BASE_URL}/api/game/compact",
+            data=b"not gzip",
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        )
+        assert response.status_code == 400
+
+    def test_truncated_gzip_body(self):
+        """Test a gzip body cut off before its end is rejected rather than parsed as a prefix"""
+        payload = {"week": 1, "home_team": "A", "away_team": "B", "columns": ["pass_yards"], "home": {"Tester": [10]}}
+        compressed = gzip.compress(json.dumps(payload).encode())
+        response = requests.post(
+            f"{BASE_URL}/api/game/compact",
+            data=compressed[:-8],
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Truncated gzip request body"
+
+
+class TestBootstrap:
+    """Bootstrap bundle endpoint tests"""
+    
+    def test_bootstrap_bundle(self):
+        """Test bootstrap returns every slowly changing league section"""
+        response = requests.get(f"{BASE_URL}/api/bootstrap")
+        assert response.status_code == 200
+        data = response.json()
+        
+        for key in ["version", "teams", "standings", "schedule", "power_rankings", "awards", "playoffs"]:
+            assert key in data
+        assert response.headers.get("ETag") == f'"{data["version"]}"'
+    
+    def test_bootstrap_not_modified(self):
+        """Test bootstrap honours If-None-Match"""
+        etag = requests.get(f"{BASE_URL}/api/bootstrap").headers["ETag"]
+        response = requests.get(f"{BASE_URL}/api/bootstrap", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
 class TestRobloxAPI:
     """Roblox API integration tests"""
     
@@ -381,6 +713,84 @@ class TestPowerRankings:
         for i, ranking in enumerate(data):
             assert ranking["rank"] == i + 1
 
+    def test_power_rankings_ordered_by_elo(self):
+        """Test rankings follow team ratings and carry strength of schedule"""
+        data = requests.get(f"{BASE_URL}/api/power-rankings").json()
+        elos = [ranking["elo"] for ranking in data]
+        assert elos == sorted(elos, reverse=True)
+        assert all("sos" in ranking for ranking in data)
+
+    def test_team_rating_history(self):
+        """Test the weekly rating history ends at the team's current rating"""
+        response = requests.get(f"{BASE_URL}/api/teams/rd1/ratings")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert "strength_of_schedule" in data
+        weeks = [entry["week"] for entry in data["history"]]
+        assert weeks == sorted(weeks)
+        if data["history"]:
+            assert data["history"][-1]["rating"] == data["rating"]
+
+
+class TestSimulation:
+    """Season simulation endpoint tests"""
+    
+    def test_simulation_probabilities(self):
+        """Test championship odds sum to 100% and seeds cover each conference"""
+        response = requests.get(f"{BASE_URL}/api/simulation/season", params={"iterations": 2000, "seed": 7})
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["iterations"] == 2000
+        assert len(data["teams"]) == 12
+        total = sum(team["championship_pct"] for team in data["teams"])
+        assert abs(total - 100) < 0.5
+        for team in data["teams"]:
+            assert 0 <= team["playoff_pct"] <= 100
+            assert abs(sum(team["seed_pct"]) - 100) < 0.5
+    
+    def test_simulation_cached_per_version(self):
+        """Test a repeated request is served from the cache"""
+        params = {"iterations": 2000, "seed": 11}
+        first = requests.get(f"{BASE_URL}/api/simulation/season", params=params).json()
+        second = requests.get(f"{BASE_URL}/api/simulation/season", params=params).json()
+        assert first["generated_at"] == second["generated_at"]
+    
+    def test_api_responsive_during_simulation(self):
+        """Test a 100k-iteration simulation runs off the event loop"""
+        import threading
+        import time
+        
+        finished = {}
+        
+        def simulate():
+            response = requests.get(
+                f"{BASE_URL}/api/simulation/season",
+                params={"iterations": 100000, "seed": int(time.time())}
+            )
+            finished["status"] = response.status_code
+            finished["at"] = time.perf_counter()
+        
+        worker = threading.Thread(target=simulate)
+        worker.start()
+        time.sleep(0.1)
+        probe_started = time.perf_counter()
+        response = requests.get(f"{BASE_URL}/api/")
+        probe_finished = time.perf_counter()
+        worker.join()
+        
+        assert response.status_code == 200
+        if finished["status"] != 200 or finished["at"] <= probe_started:
+            pytest.skip("Simulation was not running while the probe was sent")
+        # Ordering, not wall-clock budgets: a blocked event loop would answer the probe only after the simulation
+        assert probe_finished < finished["at"]
+    
+    def test_simulation_iteration_bounds(self):
+        """Test iteration counts outside the allowed range are rejected"""
+        response = requests.get(f"{BASE_URL}/api/simulation/season", params={"iterations": 10})
+        assert response.status_code == 422
+
 
 class TestTrades:
     """Trades endpoint tests"""
@@ -390,9 +800,41 @@ class TestTrades:
         response = requests.get(f"{BASE_URL}/api/trades")
         assert response.status_code == 200
         data = response.json()
-        
+
         assert isinstance(data, list)
 
+    def test_evaluate_trade(self):
+        """Test a trade evaluation mirrors value and depth across both sides"""
+        teams = requests.get(f"{BASE_URL}/api/teams").json()
+        team1, team2 = teams[0]["id"], teams[1]["id"]
+        roster1 = requests.get(f"{BASE_URL}/api/teams/{team1}/roster").json()["roster"]
+        roster2 = requests.get(f"{BASE_URL}/api/teams/{team2}/roster").json()["roster"]
+        payload = {
+            "team1_id": team1,
+            "team2_id": team2,
+            "team1_sends": [p["id"] for p in roster1[:1]],
+            "team2_sends": [p["id"] for p in roster2[:1]],
+        }
+        response = requests.post(f"{BASE_URL}/api/trades/evaluate", json=payload)
+        assert response.status_code == 200
+        data = response.json()
+
+        side1, side2 = data["teams"]
+        assert side1["value_sent"] == side2["value_received"]
+        assert side1["value_delta"] == -side2["value_delta"]
+        assert data["grade"] in ("A", "B", "C", "F")
+        assert "depth" in side1 and "needs" in side1
+
+    def test_evaluate_trade_rejects_wrong_team(self):
+        """Test sending a player from the other roster is rejected"""
+        teams = requests.get(f"{BASE_URL}/api/teams").json()
+        roster2 = requests.get(f"{BASE_URL}/api/teams/{teams[1]['id']}/roster").json()["roster"]
+        if not roster2:
+            pytest.skip("No rostered players")
+        payload = {"team1_id": teams[0]["id"], "team2_id": teams[1]["id"], "team1_sends": [roster2[0]["id"]]}
+        response = requests.post(f"{BASE_URL}/api/trades/evaluate", json=payload)
+        assert response.status_code == 400
+
 
 class TestAwards:
     """Awards endpoint tests"""
@@ -411,6 +853,49 @@ class TestAwards:
             assert "player_name" in award
 
 
+class TestSeasons:
+    """Season partitioning tests"""
+    
+    def test_list_seasons(self):
+        """Test exactly one season is current"""
+        response = requests.get(f"{BASE_URL}/api/seasons")
+        assert response.status_code == 200
+        data = response.json()
+        
+        current = [s for s in data["seasons"] if s.get("current")]
+        assert len(current) == 1
+        assert current[0]["id"] == data["current"]
+    
+    def test_awards_scoped_to_season(self):
+        """Test awards carry the current season and unknown seasons are empty"""
+        current = requests.get(f"{BASE_URL}/api/seasons").json()["current"]
+        for award in requests.get(f"{BASE_URL}/api/awards").json():
+            assert award["season"] == current
+        
+        response = requests.get(f"{BASE_URL}/api/awards", params={"season": "no-such-season"})
+        assert response.status_code == 200
+        assert response.json() == []
+    
+    def test_player_seasons_end_with_current(self):
+        """Test player season history ends with the running season"""
+        players = requests.get(f"{BASE_URL}/api/players", params={"limit": 1}).json()
+        if not players:
+            pytest.skip("No players available")
+        response = requests.get(f"{BASE_URL}/api/players/{players[0]['id']}/seasons")
+        assert response.status_code == 200
+        current = requests.get(f"{BASE_URL}/api/seasons").json()["current"]
+        assert response.json()["seasons"][-1]["season"] == current
+    
+    def test_archive_current_season_rejected(self):
+        """Test the running season cannot be archived"""
+        current = requests.get(f"{BASE_URL}/api/seasons").json()["current"]
+        response = requests.post(
+            f"{BASE_URL}/api/admin/seasons/{current}/archive",
+            headers={"X-Admin-Key": ADMIN_KEY}
+        )
+        assert response.status_code == 400
+
+
 class TestWatchlist:
     """Watchlist endpoint tests"""
     
@@ -466,7 +951,171 @@ class TestAdminEndpoints:
         assert "total_teams" in data
         assert "total_players" in data
         assert "total_games" in data
+
+    def test_game_ids_not_reused_after_delete(self):
+        """Test a deleted game's id is never handed out again"""
+        headers = {"X-Admin-Key": ADMIN_KEY}
+        game = {"week": 99, "home_team_id": "rd1", "away_team_id": "rd2", "is_completed": False, "player_stats": []}
+        first = requests.post(f"{BASE_URL}/api/admin/game", json=game, headers=headers).json()
+        requests.delete(f"{BASE_URL}/api/admin/game/{first['id']}", headers=headers)
+        second = requests.post(f"{BASE_URL}/api/admin/game", json=game, headers=headers).json()
+        requests.delete(f"{BASE_URL}/api/admin/game/{second['id']}", headers=headers)
+        assert second["id"] != first["id"]
+
+    def test_season_archive_download_unknown(self):
+        """Test downloading an archive that was never written returns 404"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/seasons/no-such-season/archive/games",
+            headers={"X-Admin-Key": ADMIN_KEY}
+        )
+        assert response.status_code == 404
+
+    def test_admin_index_report(self):
+        """Test index advisor explains the hot queries"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/indexes",
+            headers={"X-Admin-Key": ADMIN_KEY}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert "queries" in data
+        assert "unindexed" in data
+        assert len(data["queries"]) > 0
+        for query in data["queries"]:
+            assert "index_backed" in query
+    
+    def test_admin_export_game_stats_ndjson(self):
+        """Test streaming NDJSON export of per-game player stats"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/export/game-stats?format=ndjson&week=1",
+            headers={"X-Admin-Key": ADMIN_KEY}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        
+        for line in response.text.splitlines():
+            row = json.loads(line)
+            assert row["week"] == 1
+            assert "fantasy_points" in row
     
+    def test_admin_export_unknown_dataset(self):
+        """Test unknown export dataset returns 404"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/export/admins",
+            headers={"X-Admin-Key": ADMIN_KEY}
+        )
+        assert response.status_code == 404
+
+    def test_admin_update_player_recomputes_total_touchdowns(self):
+        """Test editing a stat category through the generic update keeps total_touchdowns in step"""
+        player = requests.get(f"{BASE_URL}/api/players/p1").json()
+        passing = player["passing"]
+        try:
+            response = requests.put(
+                f"{BASE_URL}/api/admin/player/p1",
+                json={"passing.touchdowns": passing["touchdowns"] + 1},
+                headers={"X-Admin-Key": ADMIN_KEY}
+            )
+            assert response.status_code == 200
+            assert response.json()["total_touchdowns"] == player["total_touchdowns"] + 1
+        finally:
+            requests.put(f"{BASE_URL}/api/admin/player/p1", json={"passing": passing}, headers={"X-Admin-Key": ADMIN_KEY})
+
+    def test_admin_games_export_keeps_legacy_headers(self):
+        """Test the legacy games export keeps its original CSV header row"""
+        response = requests.get(f"{BASE_URL}/api/admin/games/export", headers={"X-Admin-Key": ADMIN_KEY})
+        assert response.status_code == 200
+        header = response.text.splitlines()[0]
+        assert header == "ID,Week,Home Team,Away Team,Home Score,Away Score,Completed,Player of Game"
+
+    def test_admin_import_dry_run_reports_row_errors(self):
+        """Test bulk import validates every row before writing"""
+        games_csv = "week,home_team_id,away_team_id,home_score,away_score\n1,nope,alsonope,10,7\nx,,,0,0\n"
+        response = requests.post(
+            f"{BASE_URL}/api/admin/import",
+            headers={"X-Admin-Key": ADMIN_KEY},
+            files={"games": ("games.csv", games_csv, "text/csv")},
+            data={"dry_run": "true"}
+        )
+        assert response.status_code == 400
+        errors = response.json()["detail"]["errors"]
+        assert any(e.startswith("games row 1") for e in errors)
+        assert any(e.startswith("games row 2") for e in errors)
+
+    def test_admin_import_rejects_stats_for_replaced_games(self):
+        """Test stats cannot point at an existing game that replace_weeks would delete"""
+        games = requests.get(f"{BASE_URL}/api/schedule").json()["games"]
+        if not games:
+            pytest.skip("No games scheduled")
+        existing = games[0]
+        games_csv = f"week,home_team_id,away_team_id,home_score,away_score\n{existing['week']},rd1,rd2,0,0\n"
+        stats_csv = f"game_id,player_id,pass_yards\n{existing['id']},p1,10\n"
+        response = requests.post(
+            f"{BASE_URL}/api/admin/import",
+            headers={"X-Admin-Key": ADMIN_KEY},
+            files={"games": ("games.csv", games_csv, "text/csv"), "stats": ("stats.csv", stats_csv, "text/csv")},
+            data={"dry_run": "true", "replace_weeks": "true"}
+        )
+        assert response.status_code == 400
+        errors = response.json()["detail"]["errors"]
+        assert any("replace_weeks" in e for e in errors)
+
+    def test_admin_activity_log_includes_buffered_entries(self):
+        """Test an admin action is visible in the activity log right away"""
+        requests.post(f"{BASE_URL}/api/admin/indexes/apply", headers={"X-Admin-Key": ADMIN_KEY})
+        response = requests.get(
+            f"{BASE_URL}/api/admin/activity-log",
+            headers={"X-Admin-Key": ADMIN_KEY}
+        )
+        assert response.status_code == 200
+        latest = response.json()[0]
+        assert latest["action"] == "APPLY_INDEXES"
+        assert "created_at" not in latest
+
+    def test_admin_activity_log_filter_and_cursor(self):
+        """Test activity log filters by action and pages without overlap"""
+        for _ in range(3):
+            requests.post(f"{BASE_URL}/api/admin/indexes/apply", headers={"X-Admin-Key": ADMIN_KEY})
+        first = requests.get(
+            f"{BASE_URL}/api/admin/activity-log?action=APPLY_INDEXES&limit=2&paged=true",
+            headers={"X-Admin-Key": ADMIN_KEY}
+        ).json()
+        assert len(first["entries"]) == 2
+        assert all(e["action"] == "APPLY_INDEXES" for e in first["entries"])
+        assert first["next_cursor"]
+
+        second = requests.get(
+            f"{BASE_URL}/api/admin/activity-log?action=APPLY_INDEXES&limit=2&paged=true&cursor={first['next_cursor']}",
+            headers={"X-Admin-Key": ADMIN_KEY}
+        ).json()
+        first_ids = {e["id"] for e in first["entries"]}
+        assert second["entries"]
+        assert not first_ids & {e["id"] for e in second["entries"]}
+        assert second["entries"][0]["timestamp"] <= first["entries"][-1]["timestamp"]
+
+    def test_admin_activity_log_invalid_since(self):
+        """Test a malformed time filter returns 400"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/activity-log?since=yesterday",
+            headers={"X-Admin-Key": ADMIN_KEY}
+        )
+        assert response.status_code == 400
+
+    def test_admin_activity_action_counts(self):
+        """Test counts per action come back sorted by count"""
+        requests.post(f"{BASE_URL}/api/admin/indexes/apply", headers={"X-Admin-Key": ADMIN_KEY})
+        response = requests.get(
+            f"{BASE_URL}/api/admin/activity-log/actions",
+            headers={"X-Admin-Key": ADMIN_KEY}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        counts = [a["count"] for a in data["actions"]]
+        assert counts == sorted(counts, reverse=True)
+        assert "APPLY_INDEXES" in {a["action"] for a in data["actions"]}
+        assert data["total"] == sum(counts)
+
     def test_admin_get_admins(self):
         """Test getting admin list"""
         response = requests.get(
@@ -495,5 +1144,95 @@ class TestPlayerAnalytics:
         assert "defense" in data
 
 
+class TestCompression:
+    """Response compression and static caching header tests"""
+
+    def test_api_response_brotli_preferred(self):
+        """Test brotli is chosen over gzip when the client accepts both"""
+        response = requests.get(f"{BASE_URL}/api/players", headers={"Accept-Encoding": "gzip, br"}, stream=True)
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "br"
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+    def test_streamed_response_brotli_encoded(self):
+        """Test a streamed export decodes to the same body as the uncompressed stream"""
+        brotli = pytest.importorskip("brotli")
+        url = f"{BASE_URL}/api/admin/export/games?format=ndjson"
+        plain = requests.get(url, headers={"X-Admin-Key": ADMIN_KEY, "Accept-Encoding": "identity"})
+        assert plain.status_code == 200
+        response = requests.get(url, headers={"X-Admin-Key": ADMIN_KEY, "Accept-Encoding": "br"}, stream=True)
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "br"
+        assert "Content-Length" not in response.headers
+        assert brotli.decompress(response.raw.read(decode_content=False)) == plain.content
+
+    def test_api_response_gzip_when_brotli_refused(self):
+        """Test gzip is used when brotli is refused with q=0"""
+        response = requests.get(f"{BASE_URL}/api/players", headers={"Accept-Encoding": "br;q=0, gzip"}, stream=True)
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+
+    def test_api_response_uncompressed_for_identity(self):
+        """Test responses stay uncompressed when the client accepts no encoding"""
+        response = requests.get(f"{BASE_URL}/api/players", headers={"Accept-Encoding": "identity"})
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+
+    def test_small_api_response_not_compressed(self):
+        """Test responses under the minimum size are sent as-is"""
+        response = requests.get(f"{BASE_URL}/api/", headers={"Accept-Encoding": "gzip, br"})
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+
+    def index_etag(self):
+        response = requests.get(f"{BASE_URL}/")
+        if not response.headers.get("Content-Type", "").startswith("text/html"):
+            pytest.skip("Frontend build not served")
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
+        return response.headers["ETag"]
+
+    def test_index_revalidates_with_etag(self):
+        """Test index.html is revalidated with its ETag and answers 304 when unchanged"""
+        etag = self.index_etag()
+        response = requests.get(f"{BASE_URL}/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_spa_route_shares_index_etag(self):
+        """Test client-side routes serve the same cached index.html"""
+        etag = self.index_etag()
+        response = requests.get(f"{BASE_URL}/players/p1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    def hashed_bundle_path(self):
+        response = requests.get(f"{BASE_URL}/asset-manifest.json")
+        if response.status_code != 200:
+            pytest.skip("Frontend build not served")
+        path = response.json()["files"]["main.js"]
+        assert path.startswith("/static/")
+        return path
+
+    def test_precompressed_bundle_served_with_encoding(self):
+        """Test hashed bundles come from their .br/.gz siblings and are cached as immutable"""
+        path = self.hashed_bundle_path()
+        for encoding in ("br", "gzip"):
+            response = requests.get(f"{BASE_URL}{path}", headers={"Accept-Encoding": encoding}, stream=True)
+            assert response.status_code == 200
+            assert response.headers["Content-Encoding"] == encoding
+            assert response.headers["Content-Type"].startswith(("application/javascript", "text/javascript"))
+            assert response.headers["Vary"] == "Accept-Encoding"
+            assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+    def test_bundle_uncompressed_without_accept_encoding(self):
+        """Test the plain bundle is served when the client accepts no encoding"""
+        path = self.hashed_bundle_path()
+        response = requests.get(f"{BASE_URL}{path}", headers={"Accept-Encoding": "identity"})
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])